@@ -11,7 +11,8 @@
 #
 #  Features:
 #  1.  Dependency Checker: Verifies required libraries are installed on startup.
-#  2.  Multi-Provider Search: Aggregates results from different torrent sites.
+#  2.  Multi-Provider Search: Aggregates results from different torrent sites,
+#      querying all of them concurrently.
 #      - The Pirate Bay (via API)
 #      - 1337x (via web scraping)
 #  3.  Interactive UI: Uses the 'rich' library to display results in a sorted,
@@ -19,30 +20,50 @@
 #  4.  Download Hand-off: Opens the selected magnet link using the appropriate
 #      system command for Linux, macOS, and Windows.
 #  5.  Single-File Portability: All logic is contained within this single file.
+#  6.  Response Cache: Repeated searches are answered from a short-lived
+#      on-disk cache instead of hitting the torrent sites again.
 #
 #  Usage:
 #      python torrent_client.py "Your Search Query"
+#      python torrent_client.py --no-cache "Your Search Query"
+#      python torrent_client.py --plain "Your Search Query"
+#      python torrent_client.py --clear-cache
 #
 # ==============================================================================
 
+from __future__ import annotations
+
 import sys
 import os
+import asyncio
 import subprocess
 import importlib.util
 import argparse
-import json
 import re
+import time
+import shelve
+import hashlib
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from functools import lru_cache, partial, wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Dict
 from urllib.parse import quote_plus, urljoin
 
+if TYPE_CHECKING:
+    import aiohttp
+
 # --- Dependency Management ---
 
 # A list of required packages for this script to run.
 REQUIRED_PACKAGES = [
     "requests",
+    "aiohttp",
+    "ijson",
     "beautifulsoup4",
+    "lxml",
     "rich",
     "cloudscraper",
 ]
@@ -50,7 +71,8 @@ REQUIRED_PACKAGES = [
 def check_dependencies():
     """
     Checks if all required packages are installed. If not, prints instructions
-    and exits. This must be run before any other imports from these packages.
+    and exits. This must be run before any other imports from these packages,
+    which are imported lazily by the functions that use them.
     """
     missing_packages = []
     for package_name in REQUIRED_PACKAGES:
@@ -75,16 +97,12 @@ def check_dependencies():
         print("After installation, please run the application again.", file=sys.stderr)
         sys.exit(1)
 
-# --- Perform Dependency Check before proceeding ---
-check_dependencies()
+# Matches the href of the magnet anchor on a 1337x detail page
+_MAGNET_RE = re.compile(r'^magnet:\?')
 
-# --- Main Imports (post-dependency check) ---
-import requests
-import cloudscraper
-from bs4 import BeautifulSoup
-from rich.console import Console
-from rich.table import Table
-from rich.prompt import Prompt
+# URL-encodes search queries and tracker URLs, which repeat across searches
+# and provider instances in long-running or batched use
+_q = lru_cache(maxsize=256)(quote_plus)
 
 # --- Core Data Structures ---
 
@@ -101,19 +119,104 @@ class TorrentResult:
     file_count: Optional[int] = None
     upload_date: Optional[str] = None
 
+# --- Response Cache ---
+
+CACHE_PATH = Path.home() / ".torrq_cache"
+CACHE_TTL = 600  # Seconds a cached search result stays valid
+
+def _cache_key(provider_name: str, query: str) -> str:
+    return hashlib.blake2b(f"{provider_name}|{query}".encode()).hexdigest()
+
+def ttl_cache(ttl: int = CACHE_TTL):
+    """
+    Decorator for Provider.search that stores results on disk and serves
+    them for `ttl` seconds for the same (provider, query) pair, without any
+    network call. Providers with `use_cache` set to False bypass the cache.
+    """
+    def decorator(search):
+        @wraps(search)
+        async def wrapper(self, session, query: str) -> List[TorrentResult]:
+            if not self.use_cache:
+                return await search(self, session, query)
+
+            key = _cache_key(self.name, query)
+            # A broken or unreadable cache must never break a search
+            try:
+                with shelve.open(str(CACHE_PATH)) as cache:
+                    entry = cache.get(key)
+                if entry is not None:
+                    stamp, results = entry
+                    if time.time() - stamp < ttl:
+                        return results
+            except Exception:
+                pass
+
+            results = await search(self, session, query)
+            # Failed or incomplete searches must not be served for the whole TTL
+            if self.is_cacheable(results):
+                try:
+                    with shelve.open(str(CACHE_PATH)) as cache:
+                        cache[key] = (time.time(), results)
+                except Exception:
+                    pass
+            return results
+        return wrapper
+    return decorator
+
+def clear_cache():
+    """
+    Removes every cached search result. A cache that can no longer be opened
+    is removed file by file instead. Raises OSError if that fails as well.
+    """
+    try:
+        with shelve.open(str(CACHE_PATH)) as cache:
+            cache.clear()
+        return
+    except Exception:
+        pass
+    # The dbm backend may store the cache in several suffixed files
+    for path in CACHE_PATH.parent.glob(f"{CACHE_PATH.name}*"):
+        path.unlink()
+
 # --- Provider Framework ---
 
+USER_AGENT = "Mozilla/5.0 (compatible; TorrQ)"
+
+def create_session() -> aiohttp.ClientSession:
+    """
+    Creates the HTTP session shared by all providers during a run. Connections
+    are kept alive and DNS lookups are cached, so repeated requests to a host
+    skip the TCP and TLS handshakes.
+    """
+    import aiohttp
+    connector = aiohttp.TCPConnector(limit_per_host=64, keepalive_timeout=30, ttl_dns_cache=300)
+    return aiohttp.ClientSession(connector=connector, headers={'User-Agent': USER_AGENT})
+
 class Provider(ABC):
     """Abstract base class for all torrent providers."""
     def __init__(self, name: str):
         self.name = name
+        self.use_cache = True
+
+    def is_cacheable(self, results: List[TorrentResult]) -> bool:
+        """Whether a search finished cleanly enough for its results to be cached."""
+        # Empty results usually mean the site failed
+        return bool(results)
+
+    def shutdown(self, wait: bool = True):
+        """
+        Releases any worker threads held by the provider. With wait=False,
+        pending work is cancelled and running calls are abandoned.
+        """
+        pass
 
     @abstractmethod
-    def search(self, query: str) -> List[TorrentResult]:
+    async def search(self, session: aiohttp.ClientSession, query: str) -> List[TorrentResult]:
         """
         Searches for torrents matching the query.
 
         Args:
+            session (aiohttp.ClientSession): The shared HTTP session.
             query (str): The search term.
 
         Returns:
@@ -133,117 +236,198 @@ class ThePirateBayProvider(Provider):
             "udp://tracker.internetwarriors.net:1337/announce",
             "udp://tracker.leechers-paradise.org:6969/announce",
         ]
+        # The trackers never change, so encode them once for every magnet link
+        self._tracker_suffix = "".join(f"&tr={_q(t)}" for t in self.trackers)
 
-    def search(self, query: str) -> List[TorrentResult]:
+    @ttl_cache()
+    async def search(self, session: aiohttp.ClientSession, query: str) -> List[TorrentResult]:
+        import aiohttp
+        import ijson
         results = []
         params = {'q': query, 'cat': '0'}
         try:
-            response = requests.get(self.api_url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            if not data or (isinstance(data, list) and len(data) > 0 and data[0].get("name") == "No results returned"):
-                return []
-
-            for item in data:
-                magnet_link = self._build_magnet_link(item['info_hash'], item['name'])
-                results.append(TorrentResult(
-                    title=item.get('name', 'N/A'),
-                    size=self._format_size(int(item.get('size', 0))),
-                    seeders=int(item.get('seeders', 0)),
-                    leechers=int(item.get('leechers', 0)),
-                    magnet_link=magnet_link,
-                    uploader=item.get('username', 'N/A'),
-                    source=self.name,
-                    upload_date=self._format_timestamp(int(item.get('added', 0)))
-                ))
-        except (requests.RequestException, json.JSONDecodeError) as e:
+            async with session.get(self.api_url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                response.raise_for_status()
+                # Stream the JSON array item by item while the body is still
+                # arriving, instead of waiting for and parsing the whole payload
+                async for item in ijson.items_async(response.content, 'item'):
+                    # apibay answers an empty search with a single placeholder item
+                    if not results and item.get("name") == "No results returned":
+                        return []
+
+                    magnet_link = self._build_magnet_link(item['info_hash'], item['name'])
+                    results.append(TorrentResult(
+                        title=item.get('name', 'N/A'),
+                        size=self._format_size(int(item.get('size', 0))),
+                        seeders=int(item.get('seeders', 0)),
+                        leechers=int(item.get('leechers', 0)),
+                        magnet_link=magnet_link,
+                        uploader=item.get('username', 'N/A'),
+                        source=self.name,
+                        upload_date=self._format_timestamp(int(item.get('added', 0)))
+                    ))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ijson.JSONError) as e:
             # Use Rich console for formatted error printing
+            from rich.console import Console
             Console().print(f"[bold red]Error searching {self.name}: {e}[/bold red]")
+            # Items streamed before the failure are an incomplete page; drop them
+            results = []
         return results
 
     def _build_magnet_link(self, info_hash: str, name: str) -> str:
-        tracker_str = "".join([f"&tr={quote_plus(t)}" for t in self.trackers])
-        return f"magnet:?xt=urn:btih:{info_hash}&dn={quote_plus(name)}{tracker_str}"
+        return f"magnet:?xt=urn:btih:{info_hash}&dn={quote_plus(name)}{self._tracker_suffix}"
 
     @staticmethod
     def _format_size(size_bytes: int) -> str:
         if size_bytes <= 0:
             return "0 B"
-        power = 1024
-        n = 0
-        power_labels = {0: '', 1: 'K', 2: 'M', 3: 'G', 4: 'T'}
-        while size_bytes >= power and n < len(power_labels) -1:
-            size_bytes /= power
-            n += 1
-        return f"{size_bytes:.2f} {power_labels[n]}B"
+        power_labels = ('', 'K', 'M', 'G', 'T')
+        # Each unit is 2**10 of the previous one, so the bit length picks it directly
+        n = min((size_bytes.bit_length() - 1) // 10, len(power_labels) - 1)
+        return f"{size_bytes / (1 << (10 * n)):.2f} {power_labels[n]}B"
 
     @staticmethod
     def _format_timestamp(ts: int) -> str:
-        from datetime import datetime
-        return datetime.fromtimestamp(ts).strftime('%Y-%m-%d')
+        # A missing timestamp is left empty so the table shows 'N/A'
+        return time.strftime('%Y-%m-%d', time.localtime(ts)) if ts else ''
 
 class OneThreeThreeSevenXProvider(Provider):
     """Provider for 1337x.to using web scraping."""
+    # Maximum number of detail pages fetched at once while prefetching magnets,
+    # and so the number of worker threads (each with its own scraper)
+    MAGNET_PREFETCH_LIMIT = 8
+
     def __init__(self):
+        from bs4 import SoupStrainer
+        from lxml import etree
         super().__init__("1337x")
         self.base_url = "https://1337x.to"
-        self.scraper = cloudscraper.create_scraper()
-
-    def search(self, query: str) -> List[TorrentResult]:
+        # CloudScraper keeps mutable Cloudflare challenge state (such as its
+        # solve depth counter) without any locking, so every thread gets its own
+        self._scrapers = threading.local()
+        # cloudscraper is synchronous; its calls run on this pool rather than the
+        # loop's default executor, which asyncio.run waits for even after Ctrl+C
+        self._executor = ThreadPoolExecutor(max_workers=self.MAGNET_PREFETCH_LIMIT, thread_name_prefix=self.name)
+        # Compiled once, so each search walks the listing in a single C traversal
+        self._row_xp = etree.XPath("(//table[contains(@class, 'table-list')])[1]//tr")
+        self._cell_xp = etree.XPath("./td")
+        self._title_anchor_xp = etree.XPath("(.//a)[last()]")
+        # Detail pages are only parsed for their magnet anchors
+        self._magnet_strainer = SoupStrainer('a', href=_MAGNET_RE)
+
+    @ttl_cache()
+    async def search(self, session: aiohttp.ClientSession, query: str) -> List[TorrentResult]:
+        import requests
+        from lxml import etree, html as lxml_html
         results = []
-        search_url = f"{self.base_url}/search/{quote_plus(query)}/1/"
+        search_url = f"{self.base_url}/search/{_q(query)}/1/"
         try:
-            response = self.scraper.get(search_url, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(self._executor, self._fetch, search_url, 15)
+            doc = lxml_html.fromstring(response.text)
 
-            table = soup.find('table', class_='table-list')
-            if not table:
-                return []
-
-            for row in table.find_all('tr'):
-                cols = row.find_all('td')
+            for row in self._row_xp(doc):
+                cols = self._cell_xp(row)
                 if len(cols) < 6: # Ensure row has enough columns
                     continue
 
-                title_col = cols[0]
-                title_anchor = title_col.find_all('a')[-1]
-                title = title_anchor.text.strip()
-                detail_url = urljoin(self.base_url, title_anchor['href'])
+                title_anchor = self._title_anchor_xp(cols[0])[0]
+                title = title_anchor.text_content().strip()
+                detail_url = urljoin(self.base_url, title_anchor.get('href'))
 
-                seeders = int(cols[1].text.strip())
-                leechers = int(cols[2].text.strip())
-                upload_date = cols[3].text.strip()
-                size = cols[4].text.strip()
+                seeders = int(cols[1].text_content().strip())
+                leechers = int(cols[2].text_content().strip())
+                upload_date = cols[3].text_content().strip()
+                size = cols[4].text_content().strip()
                 uploader_col = cols[5]
-                uploader_anchor = uploader_col.find('a')
-                uploader = uploader_anchor.text.strip() if uploader_anchor else uploader_col.text.strip()
+                uploader_anchor = uploader_col.find('.//a')
+                uploader = (uploader_anchor if uploader_anchor is not None else uploader_col).text_content().strip()
 
                 results.append(TorrentResult(
                     title=title,
                     size=size,
                     seeders=seeders,
                     leechers=leechers,
-                    magnet_link=detail_url, # Store detail URL for later fetching
+                    magnet_link=detail_url, # Replaced by the magnet link once prefetched
                     uploader=uploader,
                     source=self.name,
                     upload_date=upload_date
                 ))
-        except requests.RequestException as e:
+
+            await self._prefetch_magnets(results)
+        except (requests.RequestException, etree.ParserError) as e:
+            from rich.console import Console
             Console().print(f"[bold red]Error searching {self.name}: {e}[/bold red]")
         return results
 
-    def get_magnet(self, detail_url: str) -> Optional[str]:
-        """Fetches the magnet link from a torrent's detail page."""
+    def is_cacheable(self, results: List[TorrentResult]) -> bool:
+        # A row whose magnet prefetch failed still holds its detail page URL;
+        # caching it would hide a retry of that prefetch for the whole TTL
+        return super().is_cacheable(results) and all(r.magnet_link.startswith("magnet:") for r in results)
+
+    def _get_scraper(self):
+        """Returns the calling thread's scraper, creating it on first use."""
+        scraper = getattr(self._scrapers, "scraper", None)
+        if scraper is None:
+            import cloudscraper
+            scraper = self._scrapers.scraper = cloudscraper.create_scraper()
+        return scraper
+
+    def _fetch(self, url: str, timeout: int):
+        """Fetches a page with the calling thread's scraper."""
+        response = self._get_scraper().get(url, timeout=timeout)
+        response.raise_for_status()
+        return response
+
+    async def _prefetch_magnets(self, results: List[TorrentResult]):
+        """
+        Resolves the magnet link of every result concurrently, so that it is
+        already known by the time the user picks a torrent. Results whose
+        detail page could not be fetched keep their detail page URL.
+        """
+        sem = asyncio.Semaphore(self.MAGNET_PREFETCH_LIMIT)
+
+        async def fetch(result: TorrentResult):
+            async with sem:
+                # A bad detail page must only affect its own row, never the listing.
+        # Failures stay quiet here; picking the row retries and reports them.
+                try:
+                    magnet = await self._get_magnet_async(result.magnet_link)
+                except Exception:
+                    return
+                if magnet:
+                    result.magnet_link = magnet
+
+        await asyncio.gather(*(fetch(r) for r in results))
+
+    async def _get_magnet_async(self, detail_url: str) -> Optional[str]:
+        """Runs get_magnet on the provider's thread pool, without reporting errors."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(self.get_magnet, detail_url, report_errors=False))
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def get_magnet(self, detail_url: str, report_errors: bool = True) -> Optional[str]:
+        """
+        Fetches the magnet link from a torrent's detail page. Speculative
+        prefetches pass report_errors=False; only a fetch for a torrent the
+        user picked should print its failure.
+        """
+        import requests
+        from bs4 import BeautifulSoup
+        from cloudscraper.exceptions import CloudflareException
         try:
-            response = self.scraper.get(detail_url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            magnet_anchor = soup.find('a', href=re.compile(r'^magnet:\?'))
+            response = self._fetch(detail_url, 10)
+            # The strainer already dropped every other tag, so the first anchor is the magnet
+            soup = BeautifulSoup(response.text, 'lxml', parse_only=self._magnet_strainer)
+            magnet_anchor = soup.find('a')
             if magnet_anchor:
                 return magnet_anchor['href']
-        except requests.RequestException as e:
+        except (requests.RequestException, CloudflareException) as e:
+            if not report_errors:
+                return None
+            from rich.console import Console
             Console().print(f"[bold red]Error fetching magnet from {self.name}: {e}[/bold red]")
         return None
 
@@ -254,6 +438,7 @@ def open_magnet_link(magnet_link: str):
     Opens the given magnet link in the system's default BitTorrent client.
     This function is cross-platform.
     """
+    from rich.console import Console
     console = Console()
     console.print(f"\n[cyan]Attempting to open magnet link in your default client...[/cyan]")
     platform = sys.platform
@@ -280,29 +465,104 @@ def open_magnet_link(magnet_link: str):
         console.print(f"\n[bold]{magnet_link}[/bold]\n")
         console.print(f"(System Error: {e})", style="dim")
 
+# --- Result Display ---
+
+def _seeder_style(seeders: int) -> str:
+    """Color for a seeder count, based on torrent health."""
+    return "green" if seeders > 5 else ("yellow" if seeders > 0 else "red")
+
+def print_plain_results(results: List[TorrentResult]):
+    """
+    Prints the results as tab-separated lines without any styling. Much
+    faster than rendering a rich table, and easy to pipe into other tools.
+    """
+    sys.stdout.write("".join(
+        f"{i}\t{r.title}\t{r.size}\t{r.seeders}\t{r.leechers}\t{r.upload_date or 'N/A'}\t{r.uploader}\t{r.source}\n"
+        for i, r in enumerate(results, start=1)
+    ))
+    sys.stdout.flush()
+
 # --- Main Application ---
 
 def main():
     """Main function to run the torrent search CLI."""
     parser = argparse.ArgumentParser(description="Search for torrents from the command line.")
-    parser.add_argument("query", nargs='+', help="The search query for the torrent.")
+    parser.add_argument("query", nargs='*', help="The search query for the torrent.")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached results and query every site again.")
+    parser.add_argument("--clear-cache", action="store_true", help="Remove all cached search results.")
+    parser.add_argument("--plain", action="store_true", help="Print results as plain tab-separated lines instead of a table.")
     args = parser.parse_args()
     query = " ".join(args.query)
 
+    if not args.clear_cache and not query:
+        parser.error("the following arguments are required: query")
+
+    check_dependencies()
+    from rich.console import Console
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+    from rich.text import Text
+    from rich.prompt import Prompt
+
     console = Console()
+
+    if args.clear_cache:
+        try:
+            clear_cache()
+            console.print("[green]Cleared cached search results.[/green]")
+        except OSError as e:
+            console.print(f"[bold red]Could not clear the cache at {CACHE_PATH}: {e}[/bold red]")
+        if not query:
+            return
+
     console.print(f"[bold cyan]Searching for: '{query}'...[/bold cyan]")
 
     providers: List[Provider] = [ThePirateBayProvider(), OneThreeThreeSevenXProvider()]
+    for provider in providers:
+        provider.use_cache = not args.no_cache
     all_results: List[TorrentResult] = []
 
-    with console.status("[bold green]Aggregating results...") as status:
+    async def search(provider: Provider, session: aiohttp.ClientSession) -> List[TorrentResult]:
+        # A failing provider must not cancel the others in the task group
+        try:
+            return await provider.search(session, query)
+        except Exception as e:
+            console.print(f"[bold red]Failed to get results from {provider.name}: {e}[/bold red]")
+            return []
+
+    def track(task: asyncio.Task, provider: Provider, progress: Progress):
+        task_id = progress.add_task(f"[bold green]Querying {provider.name}...", total=1)
+
+        def done(t: asyncio.Task):
+            # Ctrl+C cancels the task group; there is no result to report then
+            if t.cancelled():
+                progress.update(task_id, description=f"[yellow]{provider.name}: cancelled")
+                return
+            progress.update(task_id, completed=1, description=f"[green]{provider.name}: {len(t.result())} results")
+
+        task.add_done_callback(done)
+
+    async def aggregate(progress: Progress) -> List[List[TorrentResult]]:
+        async with create_session() as session:
+            async with asyncio.TaskGroup() as tg:
+                tasks = []
+                for provider in providers:
+                    task = tg.create_task(search(provider, session))
+                    track(task, provider, progress)
+                    tasks.append(task)
+        return [t.result() for t in tasks]
+
+    try:
+        with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console, transient=True) as progress:
+            for results in asyncio.run(aggregate(progress)):
+                all_results.extend(results)
+    except KeyboardInterrupt:
+        # Don't wait for scraper requests that are still blocked in a thread
         for provider in providers:
-            status.update(f"[bold green]Querying {provider.name}...")
-            try:
-                provider_results = provider.search(query)
-                all_results.extend(provider_results)
-            except Exception as e:
-                console.print(f"[bold red]Failed to get results from {provider.name}: {e}[/bold red]")
+            provider.shutdown(wait=False)
+        raise
+    for provider in providers:
+        provider.shutdown()
 
     if not all_results:
         console.print("[bold yellow]No results found.[/bold yellow]")
@@ -311,31 +571,36 @@ def main():
     # Sort results by seeders (descending) for best health
     all_results.sort(key=lambda x: x.seeders, reverse=True)
 
-    table = Table(title=f"Search Results for '{query}'")
-    table.add_column("Index", style="magenta", justify="right")
-    table.add_column("Title", style="cyan", no_wrap=False, max_width=60)
-    table.add_column("Size", style="yellow")
-    table.add_column("SE", style="green", justify="right")
-    table.add_column("LE", style="red", justify="right")
-    table.add_column("Date", style="blue")
-    table.add_column("Uploader", style="blue")
-    table.add_column("Source", style="dim")
-
-    for i, result in enumerate(all_results):
-        # Color-code seeder count based on health
-        seeder_style = "green" if result.seeders > 5 else "yellow" if result.seeders > 0 else "red"
-        table.add_row(
-            str(i + 1),
-            result.title,
-            result.size,
-            f"[{seeder_style}]{result.seeders}[/{seeder_style}]",
-            str(result.leechers),
-            result.upload_date or 'N/A',
-            result.uploader,
-            result.source
-        )
-
-    console.print(table)
+    if args.plain:
+        print_plain_results(all_results)
+    else:
+        table = Table(title=f"Search Results for '{query}'")
+        table.add_column("Index", style="magenta", justify="right")
+        table.add_column("Title", style="cyan", no_wrap=False, max_width=60)
+        table.add_column("Size", style="yellow")
+        table.add_column("SE", style="green", justify="right")
+        table.add_column("LE", style="red", justify="right")
+        table.add_column("Date", style="blue")
+        table.add_column("Uploader", style="blue")
+        table.add_column("Source", style="dim")
+
+        # Cells are plain Text so rich skips its markup parser, which would
+        # also swallow bracketed tags like '[eztv]' in scraped titles.
+        seeder_style = _seeder_style
+        for i, result in enumerate(all_results):
+            table.add_row(
+                Text(str(i + 1)),
+                Text(result.title),
+                Text(result.size),
+                # Color-code seeder count based on health
+                Text(str(result.seeders), style=seeder_style(result.seeders)),
+                Text(str(result.leechers)),
+                Text(result.upload_date or 'N/A'),
+                Text(result.uploader),
+                Text(result.source)
+            )
+
+        console.print(table)
 
     while True:
         try:
@@ -348,8 +613,9 @@ def main():
             if 0 <= choice < len(all_results):
                 selected_torrent = all_results[choice]
 
-                # If the provider is 1337x, we need to fetch the magnet link now
-                if selected_torrent.source == "1337x":
+                # Magnet links are prefetched during the search; a 1337x detail
+                # page URL left in place means that prefetch failed, so try again now
+                if not selected_torrent.magnet_link.startswith("magnet:") and selected_torrent.source == "1337x":
                     with console.status(f"[cyan]Fetching magnet link for '{selected_torrent.title[:50]}...'[/cyan]"):
                         provider_1337x = next((p for p in providers if isinstance(p, OneThreeThreeSevenXProvider)), None)
                         if provider_1337x:
@@ -380,9 +646,14 @@ if __name__ == "__main__":
     except (KeyboardInterrupt, EOFError):
         # This handles Ctrl+C gracefully at any point in the main function
         print("\n[yellow]Operation cancelled by user.[/yellow]")
-        sys.exit(0)
+        # Skip the interpreter's exit-time join of worker threads, which would
+        # otherwise wait out any scraper request abandoned by the interrupt
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(0)
     except Exception as e:
         # Catch any other unexpected errors for graceful exit
+        from rich.console import Console
         console = Console()
         console.print(f"\n[bold red]An unexpected error occurred:[/bold red]")
         console.print_exception(show_locals=True)